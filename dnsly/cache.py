@@ -0,0 +1,149 @@
+"""
+Persistent on-disk DNS result cache for dnsly.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+
+# Maximum number of cached answers kept on disk
+MAX_ENTRIES = 1000
+
+# Seconds NXDOMAIN / NoAnswer results are kept, enough to absorb retry loops
+ERROR_TTL = 0.15
+
+
+def default_cache_path() -> str:
+    """Return the cache database location, honoring $XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "dnsly", "cache.db")
+
+
+class DNSCache:
+    """
+    TTL-respecting lookup cache persisted in a SQLite database.
+    
+    Any storage problem (read-only home, locked database, ...) disables the
+    cache instead of failing the lookup.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_ttl: Optional[float] = None,
+                 error_ttl: float = ERROR_TTL, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            path: Database file [default: ~/.cache/dnsly/cache.db]
+            max_ttl: Upper bound in seconds on how long an answer is kept
+            error_ttl: Seconds to keep negative (NXDOMAIN / NoAnswer) results
+            max_entries: Number of entries kept before the oldest are evicted
+        """
+        self.path = path or default_cache_path()
+        self.max_ttl = max_ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._pending: Optional[List[Tuple[str, str, float, str]]] = None
+        
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "domain TEXT, rtype TEXT, expires REAL, payload BLOB, "
+                "PRIMARY KEY (domain, rtype))"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            self._conn = None
+    
+    def get(self, domain: str, record_type: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a query, or None if absent or expired."""
+        if self._conn is None:
+            return None
+        
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM cache WHERE domain = ? AND rtype = ? AND expires > ?",
+                    (domain.lower(), record_type.upper(), time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        
+        return json.loads(row[0]) if row else None
+    
+    def set(self, domain: str, record_type: str, result: Dict[str, Any], ttl: float) -> None:
+        """Store a successful or failed result for ttl seconds (capped at max_ttl)."""
+        if self._conn is None:
+            return
+        
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+        if ttl <= 0:
+            return
+        
+        # Rows carry the TTL; expiry is fixed when the row is written, so
+        # short-lived entries queued by deferred_writes() are not stale on arrival
+        row = (domain.lower(), record_type.upper(), ttl, json.dumps(result))
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(row)
+                return
+        self._write([row])
+    
+    @contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        """
+        Queue every set() made inside the block and write them in a single
+        transaction on exit, instead of committing once per result.
+        """
+        with self._lock:
+            self._pending = []
+        try:
+            yield
+        finally:
+            with self._lock:
+                rows, self._pending = self._pending, None
+            if rows:
+                self._write(rows)
+    
+    def _write(self, rows: List[Tuple[str, str, float, str]]) -> None:
+        """
+        Insert (domain, rtype, ttl, payload) rows, then drop expired and
+        least recently written entries.
+        """
+        if self._conn is None:
+            return
+        
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (domain, rtype, expires, payload) VALUES (?, ?, ?, ?)",
+                    [(domain, rtype, now + ttl, payload) for domain, rtype, ttl, payload in rows]
+                )
+                self._conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+                # Replaced rows get a new rowid, so the highest rowids are the
+                # most recent writes; never evict rows from this write itself
+                self._conn.execute(
+                    "DELETE FROM cache WHERE rowid NOT IN "
+                    "(SELECT rowid FROM cache ORDER BY rowid DESC LIMIT ?)",
+                    (max(self.max_entries, len(rows)),)
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+    
+    def set_error(self, domain: str, record_type: str, result: Dict[str, Any]) -> None:
+        """Store a negative result for error_ttl seconds."""
+        self.set(domain, record_type, result, self.error_ttl)
+    
+    def close(self) -> None:
+        """Close the underlying database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
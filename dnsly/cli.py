@@ -4,21 +4,29 @@ dnsly CLI - Professional DNS reconnaissance tool
 """
 
 import sys
+import asyncio
 import argparse
-import json
-from typing import List
+from typing import List, Optional
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import box
-import time
+from rich.text import Text
 
-from dnsly.core import dns_lookup
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the standard library
+    orjson = None
+
+from dnsly.cache import DNSCache, ERROR_TTL
+from dnsly.core import ALL_RECORD_TYPES
+from dnsly.core_async import async_dns_lookup_many, async_batch_lookup
 from dnsly import __version__
 
 
 console = Console()
 
+# Pre-styled status markers, so status lines skip Rich's markup parser
+_ERR = Text("✗ ", style="red")
+_OK = Text("✓ ", style="green")
+
 
 BANNER = """
 [cyan]
@@ -33,42 +41,65 @@ BANNER = """
 """
 
 
+def _raw_print(text: str) -> None:
+    """Write plain text to stdout, bypassing Rich's markup parsing."""
+    sys.stdout.write(text)
+    sys.stdout.write("\n")
+
+
 def print_banner(quiet: bool = False):
     """Print the tool banner."""
     if not quiet:
         console.print(BANNER.format(version=__version__))
 
 
+def _mx_rows(record: dict) -> List[tuple]:
+    """Table rows for an MX record."""
+    return [(str(record['preference']), record['exchange'])]
+
+
+def _soa_rows(record: dict) -> List[tuple]:
+    """Table rows for an SOA record, one per field."""
+    return [(key.upper(), str(value)) for key, value in record.items()]
+
+
+def _default_rows(record) -> List[tuple]:
+    """Table rows for a plain string record."""
+    return [(str(record),)]
+
+
+# Per record type table layout: (header, style) columns and a row builder
+_TABLE_LAYOUTS = {
+    "MX": ([("Priority", "yellow"), ("Mail Server", "green")], _mx_rows),
+    "SOA": ([("Field", "cyan"), ("Value", "green")], _soa_rows),
+}
+_DEFAULT_LAYOUT = ([("Record", "green")], _default_rows)
+
+
 def format_text_output(result: dict, verbose: bool = False) -> None:
     """Format and print results as text."""
+    from rich.table import Table
+    from rich import box
+    
     if not result["success"]:
-        console.print(f"[red]✗[/red] Error: {result['error']}")
+        console.print(_ERR + Text(f"Error: {result['error']}"))
         return
     
-    console.print(f"\n[green]✓[/green] DNS Query Results for [cyan]{result['domain']}[/cyan]")
+    console.print()
+    console.print(Text.assemble(_OK, "DNS Query Results for ", (result['domain'], "cyan")))
     console.print(f"[dim]Record Type:[/dim] [yellow]{result['record_type']}[/yellow]")
     console.print(f"[dim]Records Found:[/dim] [yellow]{result['count']}[/yellow]\n")
     
+    columns, rows = _TABLE_LAYOUTS.get(result['record_type'].upper(), _DEFAULT_LAYOUT)
+    
     # Create table for results
     table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
+    for header, style in columns:
+        table.add_column(header, style=style)
     
-    if result['record_type'].upper() == "MX":
-        table.add_column("Priority", style="yellow")
-        table.add_column("Mail Server", style="green")
-        for record in result['records']:
-            table.add_row(str(record['preference']), record['exchange'])
-    
-    elif result['record_type'].upper() == "SOA":
-        table.add_column("Field", style="cyan")
-        table.add_column("Value", style="green")
-        for record in result['records']:
-            for key, value in record.items():
-                table.add_row(key.upper(), str(value))
-    
-    else:
-        table.add_column("Record", style="green")
-        for record in result['records']:
-            table.add_row(str(record))
+    for record in result['records']:
+        for row in rows(record):
+            table.add_row(*row)
     
     console.print(table)
     
@@ -76,13 +107,25 @@ def format_text_output(result: dict, verbose: bool = False) -> None:
         console.print(f"\n[dim]Query completed successfully[/dim]")
 
 
+def _to_json(result: dict, indent: bool = True) -> str:
+    """Serialize a result, indented or on a single line."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    
+    import json
+    # Match orjson: raw UTF-8, and no spaces in single-line output
+    if indent:
+        return json.dumps(result, indent=2, ensure_ascii=False)
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
 def format_json_output(result: dict) -> None:
     """Format and print results as JSON."""
-    console.print(json.dumps(result, indent=2))
+    _raw_print(_to_json(result))
 
 
 def perform_lookup(domain: str, record_types: List[str], output_format: str, 
-                   verbose: bool, quiet: bool) -> int:
+                   verbose: bool, quiet: bool, cache: Optional[DNSCache] = None) -> int:
     """
     Perform DNS lookups and display results.
     
@@ -90,27 +133,34 @@ def perform_lookup(domain: str, record_types: List[str], output_format: str,
         Exit code (0 for success, 1 for error)
     """
     exit_code = 0
+    json_output = output_format == "json"
     
-    for record_type in record_types:
-        if not quiet and len(record_types) > 1:
-            console.print(f"\n[cyan]→[/cyan] Querying {record_type} records...")
+    # Status output would corrupt JSON, so it is only shown in text mode
+    show_status = not quiet and not json_output
+    show_headers = show_status and len(record_types) > 1
+    
+    # Issue every query concurrently so the total wait is ~1 RTT, not N
+    if show_status:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         
-        # Show progress for single queries
-        if not quiet and len(record_types) == 1:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True
-            ) as progress:
-                task = progress.add_task(f"Querying {record_type} records...", total=None)
-                result = dns_lookup(domain, record_type)
-                progress.update(task, completed=True)
-        else:
-            result = dns_lookup(domain, record_type)
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        ) as progress:
+            task = progress.add_task(f"Querying {', '.join(record_types)} records...", total=None)
+            results = asyncio.run(async_dns_lookup_many(domain, record_types, cache))
+            progress.update(task, completed=True)
+    else:
+        results = asyncio.run(async_dns_lookup_many(domain, record_types, cache))
+    
+    for record_type, result in zip(record_types, results):
+        if show_headers:
+            console.print(f"\n[cyan]→[/cyan] {record_type} records")
         
         # Format output
-        if output_format == "json":
+        if json_output:
             format_json_output(result)
         else:
             format_text_output(result, verbose)
@@ -122,6 +172,47 @@ def perform_lookup(domain: str, record_types: List[str], output_format: str,
     return exit_code
 
 
+async def _stream_batch(domains: List[str], record_types: List[str], output_format: str,
+                        verbose: bool, cache: Optional[DNSCache]) -> int:
+    """Print batch results while they complete."""
+    exit_code = 0
+    
+    async for result in async_batch_lookup(domains, record_types, cache):
+        if output_format == "json":
+            _raw_print(_to_json(result, indent=False))
+        elif not result["success"]:
+            # Results arrive in completion order, so name the failed query
+            console.print(_ERR + Text(f"{result['domain']} ({result['record_type']}): {result['error']}"))
+        else:
+            format_text_output(result, verbose)
+        if not result["success"]:
+            exit_code = 1
+    
+    return exit_code
+
+
+def perform_batch_lookup(path: str, record_types: List[str], output_format: str,
+                         verbose: bool, cache: Optional[DNSCache] = None) -> int:
+    """
+    Resolve every domain listed in a file (one per line) concurrently.
+    
+    Results are printed in completion order; JSON output is one result
+    per line (JSON Lines).
+    
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            lines = [line.strip() for line in fh]
+    except OSError as e:
+        console.print(_ERR + Text(f"Cannot read {path}: {e.strerror}"))
+        return 1
+    
+    domains = [line for line in lines if line and not line.startswith("#")]
+    return asyncio.run(_stream_batch(domains, record_types, output_format, verbose, cache))
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -136,6 +227,8 @@ Examples:
   dns-ly example.com -o json            # Output as JSON
   dns-ly example.com -v                 # Verbose output
   dns-ly example.com -q                 # Quiet mode (no banner)
+  dns-ly example.com --no-cache         # Bypass the on-disk answer cache
+  dns-ly -f domains.txt -o json         # Resolve a list of domains (JSON Lines)
 
 Supported Record Types:
   A, AAAA, CNAME, MX, NS, TXT, SOA, PTR
@@ -144,9 +237,17 @@ Supported Record Types:
     
     parser.add_argument(
         "domain",
+        nargs="?",
         help="Domain name to query"
     )
     
+    parser.add_argument(
+        "-f", "--file",
+        dest="input_file",
+        metavar="INPUT",
+        help="Resolve every domain in INPUT (one per line) concurrently"
+    )
+    
     parser.add_argument(
         "-t", "--type",
         dest="record_type",
@@ -173,6 +274,28 @@ Supported Record Types:
         help="Quiet mode (no banner)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the network instead of the on-disk cache"
+    )
+    
+    parser.add_argument(
+        "--cache-max-ttl",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Maximum time to keep a cached answer [default: record TTL]"
+    )
+    
+    parser.add_argument(
+        "--error-ttl",
+        type=float,
+        default=ERROR_TTL,
+        metavar="SECONDS",
+        help=f"Time to cache NXDOMAIN / no-answer results [default: {ERROR_TTL}]"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -181,12 +304,17 @@ Supported Record Types:
     
     args = parser.parse_args()
     
+    if args.domain is None and args.input_file is None:
+        parser.error("a domain or -f/--file is required")
+    if args.domain is not None and args.input_file is not None:
+        parser.error("a domain and -f/--file cannot be used together")
+    
     # Print banner
     print_banner(args.quiet or args.output == "json")
     
     # Parse record types
     if args.record_type.upper() == "ALL":
-        record_types = ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA"]
+        record_types = list(ALL_RECORD_TYPES)
     else:
         record_types = [rt.strip().upper() for rt in args.record_type.split(",")]
     
@@ -194,18 +322,25 @@ Supported Record Types:
     valid_types = ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA", "PTR"]
     for rt in record_types:
         if rt not in valid_types:
-            console.print(f"[red]✗[/red] Invalid record type: {rt}")
+            console.print(_ERR + Text(f"Invalid record type: {rt}"))
             console.print(f"[yellow]Valid types:[/yellow] {', '.join(valid_types)}")
             return 1
     
+    cache = None if args.no_cache else DNSCache(max_ttl=args.cache_max_ttl, error_ttl=args.error_ttl)
+    
     # Perform lookup
     try:
+        if args.input_file is not None:
+            return perform_batch_lookup(args.input_file, record_types, args.output,
+                                        args.verbose, cache)
+        
         exit_code = perform_lookup(
             args.domain,
             record_types,
             args.output,
             args.verbose,
-            args.quiet
+            args.quiet,
+            cache
         )
         return exit_code
     
@@ -214,11 +349,15 @@ Supported Record Types:
         return 1
     
     except Exception as e:
-        console.print(f"[red]✗[/red] Unexpected error: {str(e)}")
+        console.print(_ERR + Text(f"Unexpected error: {str(e)}"))
         if args.verbose:
             import traceback
-            console.print(traceback.format_exc())
+            _raw_print(traceback.format_exc())
         return 1
+    
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -2,9 +2,31 @@
 Core DNS lookup functionality for dnsly.
 """
 
+import time
+import ipaddress
 import dns.resolver
-import dns.reversename
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from dnsly.cache import DNSCache
+
+
+# Record types queried by "-t ALL"
+ALL_RECORD_TYPES = ["A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA"]
+
+# Byte values used by the domain scanner
+_DOT = ord(".")
+_HYPHEN = ord("-")
+_LOWER_A = ord("a")
+_LOWER_Z = ord("z")
+_UPPER_A = ord("A")
+_UPPER_Z = ord("Z")
+_DIGIT_0 = ord("0")
+_DIGIT_9 = ord("9")
+
+# Shared resolver: built (and /etc/resolv.conf parsed) once per process, with
+# a TTL-aware answer cache so repeated queries skip the network
+_RESOLVER = dns.resolver.Resolver()
+_RESOLVER.cache = dns.resolver.LRUCache(max_size=1000)
 
 
 def validate_domain(domain: str) -> bool:
@@ -17,125 +39,195 @@ def validate_domain(domain: str) -> bool:
     Returns:
         True if valid domain, False otherwise
     """
-    import re
-    
     if not domain or len(domain) > 253:
         return False
     
-    # Regular expression for domain validation
-    domain_regex = re.compile(
-        r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
-    )
+    try:
+        data = domain.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    
+    # Single left-to-right pass: every label is 1-63 alphanumerics/hyphens
+    # that neither starts nor ends with a hyphen, and the final label (TLD)
+    # is at least two letters.
+    labels = 0
+    label_len = 0
+    label_alpha = True
+    prev = _DOT
+    
+    for b in data:
+        if b == _DOT:
+            if label_len == 0 or prev == _HYPHEN:
+                return False
+            labels += 1
+            label_len = 0
+            label_alpha = True
+        elif b == _HYPHEN:
+            if label_len == 0:
+                return False
+            label_len += 1
+            label_alpha = False
+        elif _LOWER_A <= b <= _LOWER_Z or _UPPER_A <= b <= _UPPER_Z:
+            label_len += 1
+        elif _DIGIT_0 <= b <= _DIGIT_9:
+            label_len += 1
+            label_alpha = False
+        else:
+            return False
+        
+        if label_len > 63:
+            return False
+        prev = b
     
-    return bool(domain_regex.match(domain))
+    return labels > 0 and label_len >= 2 and label_alpha
+
+
+def _error_result(domain: str, record_type: str, error: str) -> Dict[str, Any]:
+    """Build a failed lookup result."""
+    return {
+        "success": False,
+        "error": error,
+        "domain": domain,
+        "record_type": record_type
+    }
 
 
-def dns_lookup(domain: str, record_type: str = "A") -> Dict[str, Any]:
+def _prepare_query(domain: str, record_type: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Validate the input and resolve the name that should actually be queried.
+    
+    Args:
+        domain: Domain name (or IP address for PTR) to lookup
+        record_type: Upper-case DNS record type
+    
+    Returns:
+        Tuple of (query name, error result or None)
+    """
+    # For PTR records, we need an IP address rather than a domain name
+    if record_type == "PTR":
+        try:
+            ip = ipaddress.ip_address(domain)
+            
+            # IPv4-mapped IPv6 addresses are looked up under in-addr.arpa
+            if ip.version == 6 and ip.ipv4_mapped is not None:
+                ip = ip.ipv4_mapped
+            
+            # Convert IP to (absolute) in-addr.arpa / ip6.arpa format;
+            # scoped IPv6 addresses (fe80::1%eth0) are rejected here
+            return ip.reverse_pointer + ".", None
+        except ValueError:
+            return domain, _error_result(domain, record_type, "Invalid IP address for PTR lookup")
+    
+    # Validate domain
+    if not validate_domain(domain):
+        return domain, _error_result(domain, record_type, "Invalid domain format")
+    
+    return domain, None
+
+
+def _format_mx(rdata) -> Dict[str, Any]:
+    """Format an MX rdata."""
+    return {
+        "preference": rdata.preference,
+        "exchange": str(rdata.exchange)
+    }
+
+
+def _format_txt(rdata) -> str:
+    """Format a TXT rdata."""
+    return str(rdata).strip('"')
+
+
+def _format_soa(rdata) -> Dict[str, Any]:
+    """Format an SOA rdata."""
+    return {
+        "mname": str(rdata.mname),
+        "rname": str(rdata.rname),
+        "serial": rdata.serial,
+        "refresh": rdata.refresh,
+        "retry": rdata.retry,
+        "expire": rdata.expire,
+        "minimum": rdata.minimum
+    }
+
+
+# Per record type rdata formatters; anything else is rendered with str()
+_FORMATTERS = {
+    "MX": _format_mx,
+    "TXT": _format_txt,
+    "SOA": _format_soa,
+}
+
+
+def _build_result(domain: str, record_type: str, answers) -> Dict[str, Any]:
+    """Convert a dnspython answer into a successful lookup result."""
+    # Pick the formatter once, then convert every rdata with it
+    fmt = _FORMATTERS.get(record_type, str)
+    results = [fmt(rdata) for rdata in answers]
+    
+    return {
+        "success": True,
+        "domain": domain,
+        "record_type": record_type,
+        "records": results,
+        "count": len(results)
+    }
+
+
+def _exception_result(domain: str, record_type: str, exc: Exception) -> Dict[str, Any]:
+    """Map an exception raised while resolving into a failed lookup result."""
+    if isinstance(exc, dns.resolver.NXDOMAIN):
+        return _error_result(domain, record_type, "Domain does not exist")
+    if isinstance(exc, dns.resolver.NoAnswer):
+        return _error_result(domain, record_type, f"No {record_type} records found")
+    if isinstance(exc, dns.resolver.Timeout):
+        return _error_result(domain, record_type, "DNS query timed out")
+    if isinstance(exc, dns.exception.DNSException):
+        return _error_result(domain, record_type, f"DNS error: {str(exc)}")
+    return _error_result(domain, record_type, f"Unexpected error: {str(exc)}")
+
+
+def dns_lookup(domain: str, record_type: str = "A",
+               cache: Optional[DNSCache] = None) -> Dict[str, Any]:
     """
     Perform DNS lookup for a domain.
     
     Args:
         domain: Domain name to lookup
         record_type: DNS record type (A, AAAA, MX, TXT, CNAME, NS, SOA, PTR)
+        cache: Optional persistent cache consulted before the network
     
     Returns:
         Dictionary with DNS lookup results
     """
-    # Validate domain
-    if not validate_domain(domain):
-        return {
-            "success": False,
-            "error": "Invalid domain format",
-            "domain": domain,
-            "record_type": record_type
-        }
-    
-    # For PTR records, we need an IP address
-    if record_type.upper() == "PTR":
-        try:
-            # Convert IP to in-addr.arpa format
-            reversed_name = dns.reversename.from_address(domain)
-            domain = str(reversed_name)
-        except Exception:
-            return {
-                "success": False,
-                "error": "Invalid IP address for PTR lookup",
-                "domain": domain,
-                "record_type": record_type
-            }
+    record_type = record_type.upper()
+    
+    if cache is not None:
+        cached = cache.get(domain, record_type)
+        if cached is not None:
+            return cached
+    
+    query_name, error = _prepare_query(domain, record_type)
+    if error is not None:
+        return error
     
     try:
-        # Create resolver
-        resolver = dns.resolver.Resolver()
-        
         # Perform query
-        answers = resolver.resolve(domain, record_type)
-        
-        # Process results based on record type
-        results = []
-        for rdata in answers:
-            if record_type.upper() == "MX":
-                results.append({
-                    "preference": rdata.preference,
-                    "exchange": str(rdata.exchange)
-                })
-            elif record_type.upper() == "TXT":
-                results.append(str(rdata).strip('"'))
-            elif record_type.upper() == "SOA":
-                results.append({
-                    "mname": str(rdata.mname),
-                    "rname": str(rdata.rname),
-                    "serial": rdata.serial,
-                    "refresh": rdata.refresh,
-                    "retry": rdata.retry,
-                    "expire": rdata.expire,
-                    "minimum": rdata.minimum
-                })
-            else:
-                results.append(str(rdata))
+        answers = _RESOLVER.resolve(query_name, record_type)
         
-        return {
-            "success": True,
-            "domain": domain,
-            "record_type": record_type,
-            "records": results,
-            "count": len(results)
-        }
-    
-    except dns.resolver.NXDOMAIN:
-        return {
-            "success": False,
-            "error": "Domain does not exist",
-            "domain": domain,
-            "record_type": record_type
-        }
-    except dns.resolver.NoAnswer:
-        return {
-            "success": False,
-            "error": f"No {record_type} records found",
-            "domain": domain,
-            "record_type": record_type
-        }
-    except dns.resolver.Timeout:
-        return {
-            "success": False,
-            "error": "DNS query timed out",
-            "domain": domain,
-            "record_type": record_type
-        }
-    except dns.exception.DNSException as e:
-        return {
-            "success": False,
-            "error": f"DNS error: {str(e)}",
-            "domain": domain,
-            "record_type": record_type
-        }
+        result = _build_result(query_name, record_type, answers)
+        if cache is not None:
+            # Remaining lifetime, which is shorter than the record TTL
+            # when the answer came from the in-memory cache
+            cache.set(domain, record_type, result, answers.expiration - time.time())
+        return result
+    
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        result = _exception_result(query_name, record_type, e)
+        if cache is not None:
+            cache.set_error(domain, record_type, result)
+        return result
+    
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}",
-            "domain": domain,
-            "record_type": record_type
-        }
-
+        return _exception_result(query_name, record_type, e)
 
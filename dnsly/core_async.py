@@ -0,0 +1,215 @@
+"""
+Asynchronous DNS lookup functionality for dnsly.
+"""
+
+import time
+import asyncio
+import contextlib
+import dns.asyncquery
+import dns.asyncresolver
+import dns.flags
+import dns.message
+import dns.name
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+from dnsly.cache import DNSCache
+from dnsly.core import (
+    ALL_RECORD_TYPES,
+    _RESOLVER,
+    _prepare_query,
+    _build_result,
+    _exception_result,
+)
+
+
+# Upper bound on in-flight queries sharing a single resolver
+MAX_CONCURRENT_QUERIES = 32
+
+# Batch mode: in-flight query cap and answer cache size
+MAX_BATCH_QUERIES = 64
+BATCH_CACHE_SIZE = 10000
+
+# Seconds to wait for the "-t ALL" ANY probe before falling back to
+# per-type queries; kept short since most public resolvers refuse ANY
+ANY_QUERY_TIMEOUT = 0.5
+
+# Shared asynchronous resolver, backed by the same answer cache as the
+# synchronous one
+_ASYNC_RESOLVER = dns.asyncresolver.Resolver()
+_ASYNC_RESOLVER.cache = _RESOLVER.cache
+
+
+async def async_dns_lookup(resolver: dns.asyncresolver.Resolver, domain: str,
+                           record_type: str = "A",
+                           cache: Optional[DNSCache] = None) -> Dict[str, Any]:
+    """
+    Perform an asynchronous DNS lookup for a domain.
+    
+    Args:
+        resolver: Shared asynchronous resolver
+        domain: Domain name to lookup
+        record_type: DNS record type (A, AAAA, MX, TXT, CNAME, NS, SOA, PTR)
+        cache: Optional persistent cache consulted before the network
+    
+    Returns:
+        Dictionary with DNS lookup results
+    """
+    record_type = record_type.upper()
+    
+    if cache is not None:
+        cached = cache.get(domain, record_type)
+        if cached is not None:
+            return cached
+    
+    query_name, error = _prepare_query(domain, record_type)
+    if error is not None:
+        return error
+    
+    try:
+        answers = await resolver.resolve(query_name, record_type)
+        result = _build_result(query_name, record_type, answers)
+        if cache is not None:
+            # Remaining lifetime, which is shorter than the record TTL
+            # when the answer came from the in-memory cache
+            cache.set(domain, record_type, result, answers.expiration - time.time())
+        return result
+    
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        result = _exception_result(query_name, record_type, e)
+        if cache is not None:
+            cache.set_error(domain, record_type, result)
+        return result
+    
+    except Exception as e:
+        return _exception_result(query_name, record_type, e)
+
+
+async def _query_any(resolver: dns.asyncresolver.Resolver, domain: str) -> Dict[str, dns.rrset.RRset]:
+    """
+    Fetch every record type for a domain with a single ANY query.
+    
+    Args:
+        resolver: Resolver whose first nameserver is queried
+        domain: Domain name to lookup
+    
+    Returns:
+        RRsets owned by the domain keyed by record type. Empty when the
+        server refuses ANY (RFC 8482 HINFO answer), truncates, or fails.
+    """
+    where = resolver.nameservers[0] if resolver.nameservers else None
+    if not isinstance(where, str):
+        return {}
+    
+    try:
+        qname = dns.name.from_text(domain)
+        query = dns.message.make_query(qname, dns.rdatatype.ANY)
+        port = resolver.nameserver_ports.get(where, resolver.port)
+        response = await dns.asyncquery.udp(query, where, timeout=ANY_QUERY_TIMEOUT, port=port)
+    except Exception:
+        return {}
+    
+    if response.flags & dns.flags.TC or response.rcode() != dns.rcode.NOERROR:
+        return {}
+    
+    return {
+        dns.rdatatype.to_text(rrset.rdtype): rrset
+        for rrset in response.answer
+        if rrset.name == qname
+    }
+
+
+async def async_dns_lookup_many(domain: str, record_types: List[str],
+                                cache: Optional[DNSCache] = None) -> List[Dict[str, Any]]:
+    """
+    Query several record types for a domain concurrently.
+    
+    Args:
+        domain: Domain name to lookup
+        record_types: DNS record types to query
+        cache: Optional persistent cache consulted before the network
+    
+    Returns:
+        List of lookup results, in the same order as record_types
+    """
+    resolver = _ASYNC_RESOLVER
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    
+    cached: Dict[str, Dict[str, Any]] = {}
+    if cache is not None:
+        for record_type in record_types:
+            hit = cache.get(domain, record_type)
+            if hit is not None:
+                cached[record_type] = hit
+    
+    # Fast path for "-t ALL": one ANY round-trip answers every type the
+    # server is willing to return; the rest are queried individually below.
+    # Not worth the probe's timeout when it could save at most one query.
+    any_answers: Dict[str, dns.rrset.RRset] = {}
+    if set(record_types) == set(ALL_RECORD_TYPES) and len(record_types) - len(cached) > 1:
+        query_name, error = _prepare_query(domain, record_types[0])
+        if error is None:
+            any_answers = await _query_any(resolver, query_name)
+    
+    async def bounded_lookup(record_type: str) -> Dict[str, Any]:
+        if record_type in cached:
+            return cached[record_type]
+        if record_type in any_answers:
+            rrset = any_answers[record_type]
+            result = _build_result(domain, record_type, rrset)
+            if cache is not None:
+                cache.set(domain, record_type, result, rrset.ttl)
+            return result
+        async with semaphore:
+            return await async_dns_lookup(resolver, domain, record_type, cache)
+    
+    results = await asyncio.gather(
+        *[bounded_lookup(record_type) for record_type in record_types],
+        return_exceptions=True
+    )
+    
+    return [
+        _exception_result(domain, record_type, result) if isinstance(result, BaseException) else result
+        for record_type, result in zip(record_types, results)
+    ]
+
+
+async def async_batch_lookup(domains: List[str], record_types: List[str],
+                             cache: Optional[DNSCache] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Query many domains concurrently through one shared resolver.
+    
+    Every query goes through the resolver so the batch shares its answer
+    cache. Cache writes are committed once at the end.
+    
+    Args:
+        domains: Domain names to lookup
+        record_types: DNS record types to query for every domain
+        cache: Optional persistent cache consulted before the network
+    
+    Yields:
+        Lookup results in completion order
+    """
+    resolver = dns.asyncresolver.Resolver()
+    resolver.cache = dns.resolver.LRUCache(max_size=BATCH_CACHE_SIZE)
+    semaphore = asyncio.Semaphore(MAX_BATCH_QUERIES)
+    
+    async def bounded_lookup(domain: str, record_type: str) -> Dict[str, Any]:
+        try:
+            async with semaphore:
+                return await async_dns_lookup(resolver, domain, record_type, cache)
+        except Exception as e:
+            return _exception_result(domain, record_type, e)
+    
+    with cache.deferred_writes() if cache is not None else contextlib.nullcontext():
+        tasks = [
+            asyncio.ensure_future(bounded_lookup(domain, record_type))
+            for domain in domains
+            for record_type in record_types
+        ]
+        
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result